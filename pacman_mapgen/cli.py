@@ -1,37 +1,83 @@
-import argparse
+from __future__ import annotations
+
+import functools
+import importlib
+import os
 import sys
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from pacman_mapgen.constants import (
     DEFAULT_CYCLE_PROBABILITY,
+    DEFAULT_MAX_FOOD,
     DEFAULT_SEED,
     DEFAULT_WALL_PROBABILTY,
 )
-from pacman_mapgen.core import LayoutGenerator, ProblemType
-from pacman_mapgen.kruskal import KruskalLayoutGenerator
-from pacman_mapgen.prim import PrimLayoutGenerator
-from pacman_mapgen.randdfs import RandomizedDfsLayoutGenerator
-from pacman_mapgen.randgen import RandomLayoutGenerator
-from pacman_mapgen.utils.type_utils import StrEnum
+
+if TYPE_CHECKING:
+    import argparse
+
+    from pacman_mapgen.core import LayoutGenerator
 
 ################
 # Main Program #
 ################
 
+# Maze generation methods. Plain strings rather than an Enum to keep
+# the start-up path free of EnumMeta machinery.
+METHOD_PRIM = "prim"
+METHOD_KRUSKAL = "kruskal"
+METHOD_RANDOM = "random"
+METHOD_DFS = "dfs"
+
+METHODS = (METHOD_PRIM, METHOD_KRUSKAL, METHOD_RANDOM, METHOD_DFS)
+
+# Maps each method to the module/class implementing it, plus any
+# method-specific constructor arguments taken from the parsed args.
+# Classes are resolved lazily so only the selected module is imported.
+_METHOD_REGISTRY = {
+    METHOD_PRIM: ("pacman_mapgen.prim", "PrimLayoutGenerator", ()),
+    METHOD_KRUSKAL: ("pacman_mapgen.kruskal", "KruskalLayoutGenerator", ()),
+    METHOD_RANDOM: (
+        "pacman_mapgen.randgen",
+        "RandomLayoutGenerator",
+        ("wall_probability",),
+    ),
+    METHOD_DFS: ("pacman_mapgen.randdfs", "RandomizedDfsLayoutGenerator", ()),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _problem_choices() -> Tuple[str, ...]:
+    """Problem type choices, computed once on first use.
 
-class LayoutMethod(StrEnum):
-    """Maze generation methods."""
+    Returns:
+        The values of `ProblemType` as a tuple of strings.
+    """
+    from pacman_mapgen.core import ProblemType
+
+    return tuple(p_type.value for p_type in ProblemType)
 
-    PRIM = "prim"
-    KRUSKAL = "kruskal"
-    RANDOM = "random"
-    RANDOM_DFS = "dfs"
 
+class ProgramArgs(object):
+    """Typed program arguments for argparse.
 
-class ProgramArgs(argparse.Namespace):
-    """Typed program arguments for argparse."""
+    A plain class (argparse only needs getattr/setattr on the
+    namespace) so importing it does not require argparse itself.
+    """
 
-    method: LayoutMethod
-    problem_type: ProblemType
+    __slots__ = (
+        "method",
+        "problem_type",
+        "width",
+        "height",
+        "seed",
+        "max_food",
+        "cycle_probability",
+        "wall_probability",
+    )
+
+    method: str
+    problem_type: str
     width: int
     height: int
     seed: int
@@ -42,81 +88,189 @@ class ProgramArgs(argparse.Namespace):
 
 def main():
     """Program main routine."""
-    args = _parse_args()
+    if sys.argv[1:] and sys.argv[1] in {"-V", "--version"}:
+        # Fast path: not even argparse is imported.
+        from pacman_mapgen import __version__
+
+        print(f"pacman-mapgen {__version__}")
+        return
+
+    parser = None
+    args = _args_from_env() if not sys.argv[1:] else None
+    if args is None:
+        argv = tuple(sys.argv[1:])
+        if os.environ.get("PACMAN_MAPGEN_CACHE_ARGS"):
+            # Opt-in: batch drivers re-running main() with identical
+            # argv skip parser construction after the first call.
+            args, parser = _parse_args_cached(argv)
+        else:
+            args, parser = _parse_args(argv)
     generator: LayoutGenerator
 
     try:
         generator = _create_layout_generator(args)
     except ValueError as err:
-        print(f"Error: {err}.")
-        sys.exit(1)
+        if parser is None:
+            print(f"Error: {err}.", file=sys.stderr)
+            sys.exit(2)
+        # Reuses argparse's stderr + exit-code-2 machinery.
+        parser.error(str(err))
+
+    # Single Enum lookup instead of per-argument coercion during parsing.
+    from pacman_mapgen.core import ProblemType
 
     layout = generator.generate_layout(
-        problem_type=args.problem_type,
+        problem_type=ProblemType(args.problem_type),
         max_food=args.max_food,
     )
-    layout.print()
+    # Single bulk write instead of one write call per row.
+    sys.stdout.write(layout.to_string() + "\n")
 
 
 def _create_layout_generator(args: ProgramArgs) -> LayoutGenerator:
-    if args.method is LayoutMethod.PRIM:
-        return PrimLayoutGenerator(
-            width=args.width,
-            height=args.height,
-            seed=args.seed,
-            cycle_probability=args.cycle_probability,
-        )
-    if args.method is LayoutMethod.KRUSKAL:
-        return KruskalLayoutGenerator(
-            width=args.width,
-            height=args.height,
-            seed=args.seed,
-            cycle_probability=args.cycle_probability,
-        )
-    if args.method is LayoutMethod.RANDOM:
-        return RandomLayoutGenerator(
-            width=args.width,
-            height=args.height,
-            seed=args.seed,
-            cycle_probability=args.cycle_probability,
-            wall_probability=args.wall_probability,
-        )
-    if args.method is LayoutMethod.RANDOM_DFS:
-        return RandomizedDfsLayoutGenerator(
-            width=args.width,
-            height=args.height,
-            seed=args.seed,
-            cycle_probability=args.cycle_probability,
+    registry_entry = _METHOD_REGISTRY.get(args.method)
+    if registry_entry is None:
+        print(
+            f"Unknown layout generator method {args.method}, expected:"
+            f" {', '.join(METHODS)}",
+            file=sys.stderr,
         )
+        sys.exit(1)
+
+    module_name, class_name, extra_args = registry_entry
+    generator_cls = getattr(importlib.import_module(module_name), class_name)
+
+    kwargs = {
+        "width": args.width,
+        "height": args.height,
+        "seed": args.seed,
+        "cycle_probability": args.cycle_probability,
+    }
+    for extra in extra_args:
+        kwargs[extra] = getattr(args, extra)
+    return generator_cls(**kwargs)
+
+
+def _args_from_env() -> Optional[ProgramArgs]:
+    """Builds program arguments from `PACMAN_MAPGEN_*` variables.
 
-    print(
-        f"Unknown layout generator method {args.method}, expected:"
-        f" {', '.join(LayoutMethod)}",
-        file=sys.stderr,
+    Lets scripted batch invocations configure the generator without
+    paying for argparse at all.
+
+    Returns:
+        A ProgramArgs instance when PACMAN_MAPGEN_METHOD is set,
+        otherwise None.
+    """
+    environ = os.environ
+    method = environ.get("PACMAN_MAPGEN_METHOD")
+    if method is None:
+        return None
+
+    args = ProgramArgs()
+    args.method = method
+    args.problem_type = environ.get("PACMAN_MAPGEN_PROBLEM_TYPE", "search")
+    args.width = int(environ["PACMAN_MAPGEN_WIDTH"])
+    args.height = int(environ["PACMAN_MAPGEN_HEIGHT"])
+    args.seed = int(environ.get("PACMAN_MAPGEN_SEED", DEFAULT_SEED))
+    args.max_food = int(environ.get("PACMAN_MAPGEN_MAX_FOOD", DEFAULT_MAX_FOOD))
+    args.cycle_probability = float(
+        environ.get("PACMAN_MAPGEN_CYCLE_PROBABILITY", DEFAULT_CYCLE_PROBABILITY),
     )
-    sys.exit(1)
+    args.wall_probability = float(
+        environ.get("PACMAN_MAPGEN_WALL_PROBABILITY", DEFAULT_WALL_PROBABILTY),
+    )
+    return args
+
+
+def _sniff_argument(argv: Tuple[str, ...], name: str) -> str | None:
+    """Scans `argv` for an argument value without a full parse.
 
+    Args:
+        argv: Command line arguments, without the program name.
+        name: Argument name, including the leading dashes.
+
+    Returns:
+        The raw argument value if present, otherwise None.
+    """
+    is_short = not name.startswith("--")
+    for index, arg in enumerate(argv):
+        if arg == name and index + 1 < len(argv):
+            return argv[index + 1]
+        if arg.startswith(name + "="):
+            return arg.split("=", 1)[1]
+        if is_short and arg.startswith(name) and len(arg) > len(name):
+            return arg[len(name):]
+    return None
+
+
+def _memoize_parser_formatter(parser: argparse.ArgumentParser) -> None:
+    """Memoizes the parser's help formatter while arguments are added.
+
+    Recent Python versions rebuild the help formatter (re-probing several
+    environment variables) on every `add_argument` call; a single cached
+    instance is enough during parser construction. Callers should drop
+    the override (`parser.__dict__.pop("_get_formatter", None)`) before
+    parsing so help/error rendering still gets fresh formatters.
+
+    Args:
+        parser: Parser whose formatter factory is memoized.
+    """
+    get_formatter = parser._get_formatter  # noqa: WPS437
+    cache = []
 
-def _parse_args() -> ProgramArgs:
+    def _cached_get_formatter() -> argparse.HelpFormatter:
+        if not cache:
+            cache.append(get_formatter())
+        return cache[0]
+
+    parser._get_formatter = _cached_get_formatter  # type: ignore[method-assign]  # noqa: WPS437
+
+
+def _parse_args(  # noqa: WPS210
+    argv: Optional[Tuple[str, ...]] = None,
+) -> Tuple[ProgramArgs, argparse.ArgumentParser]:
+    import argparse
+
+    if argv is None:
+        argv = tuple(sys.argv[1:])
+
+    sniffed_method = _sniff_argument(argv, "--method")
+    sniffed_problem = _sniff_argument(argv, "--problem-type") or _sniff_argument(
+        argv,
+        "-p",
+    )
+    wants_help = any(arg in {"-h", "--help"} for arg in argv)
+    register_all = wants_help or sniffed_method is None
+
+    # Deferred so --help never pays for the full core module import.
+    from pacman_mapgen.core import ProblemType
+
+    # The defaults-expanding formatter only matters when help is shown,
+    # and allow_abbrev's prefix matching scans every option per argument.
+    formatter_class = (
+        argparse.ArgumentDefaultsHelpFormatter
+        if wants_help
+        else argparse.HelpFormatter
+    )
     parser = argparse.ArgumentParser(
         prog="gmap2.py",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        allow_abbrev=False,
+        formatter_class=formatter_class,
     )
+    _memoize_parser_formatter(parser)
 
     parser.add_argument(
         "--method",
         action="store",
-        type=LayoutMethod,
-        choices=[method.value for method in LayoutMethod],
+        choices=METHODS,
         help="Maze generation method.",
     )
 
     parser.add_argument(
         "--problem-type",
         "-p",
-        type=ProblemType,
-        default=ProblemType.SEARCH,
-        choices=[p_type.value for p_type in ProblemType],
+        default=ProblemType.SEARCH.value,
+        choices=_problem_choices(),
         help="Generated problem type.",
     )
 
@@ -142,12 +296,13 @@ def _parse_args() -> ProgramArgs:
         help="Random number generator seed.",
     )
 
-    parser.add_argument(
-        "--max-food",
-        default=10,
-        type=arg_type_positive_int,
-        help=f"Number of food pellets for problem-type={ProblemType.FOOD} problems",
-    )
+    if wants_help or sniffed_problem == ProblemType.FOOD.value:
+        parser.add_argument(
+            "--max-food",
+            default=DEFAULT_MAX_FOOD,
+            type=arg_type_positive_int,
+            help=f"Number of food pellets for problem-type={ProblemType.FOOD} problems",
+        )
 
     parser.add_argument(
         "--cycle-probability",
@@ -157,14 +312,27 @@ def _parse_args() -> ProgramArgs:
         "spanning-tree generation to create cycles in the layout.",
     )
 
-    parser.add_argument(
-        "--wall-probability",
-        default=DEFAULT_WALL_PROBABILTY,
-        type=float,
-        help=f"Probability of cell becoming a wall (applies to: {LayoutMethod.RANDOM})",
-    )
+    if register_all or sniffed_method == METHOD_RANDOM:
+        parser.add_argument(
+            "--wall-probability",
+            default=DEFAULT_WALL_PROBABILTY,
+            type=float,
+            help="Probability of cell becoming a wall "
+            f"(applies to: {METHOD_RANDOM})",
+        )
 
-    return parser.parse_args(namespace=ProgramArgs())
+    # Restore the per-call formatter before parsing (help/error paths).
+    parser.__dict__.pop("_get_formatter", None)
+    args = parser.parse_args(list(argv), namespace=ProgramArgs())
+    if not hasattr(args, "wall_probability"):
+        args.wall_probability = DEFAULT_WALL_PROBABILTY
+    if not hasattr(args, "max_food"):
+        args.max_food = DEFAULT_MAX_FOOD
+    return args, parser
+
+
+# Enabled via PACMAN_MAPGEN_CACHE_ARGS to avoid surprising library users.
+_parse_args_cached = functools.lru_cache(maxsize=8)(_parse_args)
 
 
 def arg_type_positive_int(raw_value: str) -> int:
@@ -179,6 +347,8 @@ def arg_type_positive_int(raw_value: str) -> int:
     Raises:
         ArgumentTypeError: If the value is not a positive integer.
     """
+    import argparse
+
     try:
         ivalue = int(raw_value)
     except ValueError:
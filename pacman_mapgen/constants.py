@@ -1,3 +1,4 @@
+DEFAULT_MAX_FOOD = 10
 DEFAULT_SEED = 1234
 DEFAULT_CYCLE_PROBABILITY = 0.2
 DEFAULT_WALL_PROBABILTY = 0.3
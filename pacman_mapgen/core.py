@@ -5,7 +5,16 @@ import sys
 from enum import Enum
 from random import Random
 from types import MappingProxyType
-from typing import IO, Iterator, List, Optional, Sequence, Tuple
+from typing import (  # noqa: WPS235
+    IO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from pacman_mapgen.utils.type_utils import StrEnum
 
@@ -28,6 +37,13 @@ CellTypeToAscii = MappingProxyType(
     },
 )
 
+# Translation table turning raw cell bytes into their ASCII picture
+# in a single C-level pass (see Layout.to_string).
+_CELL_TO_ASCII = bytes.maketrans(
+    bytes(cell_type.value for cell_type in CellType),
+    "".join(CellTypeToAscii[cell_type] for cell_type in CellType).encode("ascii"),
+)
+
 
 # Not using namedtuple as it causes type conflicts when
 # overriding __add__ and __sub__ which are defined in the
@@ -61,12 +77,9 @@ class Position(object):
         Returns:
             A hash value computed from `self`'s information.
         """
-        return hash(
-            (
-                self.x_coord,
-                self.y_coord,
-            ),
-        )  # Lazy :)
+        # Direct integer mix instead of allocating a tuple to hash;
+        # coordinates are small so the shift keeps both apart.
+        return (self.y_coord << 20) ^ self.x_coord
 
     def __add__(self, other: Position) -> Position:
         """Adds the coordinates of two positions.
@@ -77,10 +90,7 @@ class Position(object):
         Returns:
             A new position resulting of adding the coordinate components.
         """
-        return Position(
-            x_coord=self.x_coord + other.x_coord,
-            y_coord=self.y_coord + other.y_coord,
-        )
+        return Position(self.x_coord + other.x_coord, self.y_coord + other.y_coord)
 
     def __sub__(self, other: Position) -> Position:
         """Subtracts the coordinates of two positions.
@@ -91,10 +101,7 @@ class Position(object):
         Returns:
             A new position resulting of subtracting the coordinate components.
         """
-        return Position(
-            x_coord=self.x_coord + other.x_coord,
-            y_coord=self.y_coord + other.y_coord,
-        )
+        return Position(self.x_coord - other.x_coord, self.y_coord - other.y_coord)
 
     def __repr__(self) -> str:
         """String representation of an instance of Position.
@@ -115,7 +122,7 @@ class Position(object):
         Returns:
             Position to the left of `self`.
         """
-        return Position(x_coord=self.x_coord - 1, y_coord=self.y_coord)
+        return Position(self.x_coord - 1, self.y_coord)
 
     @property
     def right(self) -> Position:
@@ -124,7 +131,7 @@ class Position(object):
         Returns:
             Position to the right of `self`.
         """
-        return Position(x_coord=self.x_coord + 1, y_coord=self.y_coord)
+        return Position(self.x_coord + 1, self.y_coord)
 
     @property
     def up(self) -> Position:
@@ -133,7 +140,7 @@ class Position(object):
         Returns:
             Position above `self`.
         """
-        return Position(x_coord=self.x_coord, y_coord=self.y_coord - 1)
+        return Position(self.x_coord, self.y_coord - 1)
 
     @property
     def down(self) -> Position:
@@ -142,7 +149,7 @@ class Position(object):
         Returns:
             Position below `self`.
         """
-        return Position(x_coord=self.x_coord, y_coord=self.y_coord + 1)
+        return Position(self.x_coord, self.y_coord + 1)
 
 
 class Layout(object):
@@ -150,7 +157,8 @@ class Layout(object):
 
     Provides a convenient way to interact with cells using Position
     objects rather than directly accessing the underlying data
-    structure.
+    structure, which is a flat bytearray of `CellType` values (one
+    byte per cell instead of one Python object per cell).
     """
 
     def __init__(
@@ -161,9 +169,7 @@ class Layout(object):
     ) -> None:
         self.width = width
         self.height = height
-        self._layout = [
-            [init_type for _ in range(self.width)] for _ in range(self.height)
-        ]
+        self._cells = bytearray([init_type.value] * (width * height))
 
     def __getitem__(self, position: Position) -> CellType:
         """Get cell type.
@@ -174,7 +180,7 @@ class Layout(object):
         Returns:
             Cell type.
         """
-        return self._layout[position.y_coord][position.x_coord]
+        return CellType(self._cells[position.y_coord * self.width + position.x_coord])
 
     def __setitem__(self, position: Position, cell_type: CellType) -> None:
         """Set cell type.
@@ -183,16 +189,38 @@ class Layout(object):
             position: Cell to modify.
             cell_type: New cell type.
         """
-        self._layout[position.y_coord][position.x_coord] = cell_type
+        cell_index = position.y_coord * self.width + position.x_coord
+        self._cells[cell_index] = cell_type.value
 
-    def __iter__(self) -> Iterator[Tuple[CellType, ...]]:
+    def __iter__(self) -> Iterator[memoryview]:
         """Iterator over the rows of the layout.
 
         Returns:
-            An iterator that returns the rows of the layout
-            as tuples of cells.
+            An iterator that returns the rows of the layout as
+            zero-copy read-only views holding the raw `CellType`
+            values of each cell.
+        """
+        view = memoryview(self._cells).toreadonly()
+        return (
+            view[row_start:row_start + self.width]
+            for row_start in range(0, self.width * self.height, self.width)
+        )
+
+    def is_border(self, position: Position) -> bool:
+        """Tests if the given position is a border or not.
+
+        Args:
+            position: Position to evaluate.
+
+        Returns:
+            True if `position` is located at the border, otherwise False.
         """
-        return (tuple(row) for row in self._layout)
+        return (
+            position.x_coord == 0
+            or position.x_coord == self.width - 1
+            or position.y_coord == 0
+            or position.y_coord == self.height - 1
+        )
 
     def fill_with_food(self, max_food: int, rand: Random) -> None:
         """Fills empty layout cells with food.
@@ -201,19 +229,32 @@ class Layout(object):
             max_food: Maximum number of food cells to generate.
             rand: Random engine to randomly select empty cells.
         """
+        empty_value = CellType.EMPTY.value
         empty_cells = [
-            Position(x_coord=x_coord, y_coord=y_coord)
-            for y_coord, row in enumerate(self._layout)
-            for x_coord, cell in enumerate(row)
-            if cell is CellType.EMPTY
+            cell_index
+            for cell_index, cell in enumerate(self._cells)
+            if cell == empty_value
         ]
         rand.shuffle(empty_cells)
 
+        food_value = CellType.FOOD.value
         max_food = max_food if max_food > 0 else len(empty_cells)
         while max_food > 0 and empty_cells:
-            self[empty_cells.pop()] = CellType.FOOD
+            self._cells[empty_cells.pop()] = food_value
             max_food -= 1
 
+    def to_string(self) -> str:
+        """Builds an ASCII representation of the layout.
+
+        Returns:
+            The layout as a single string, one line per row.
+        """
+        ascii_cells = self._cells.translate(_CELL_TO_ASCII)
+        return "\n".join(
+            ascii_cells[row_start:row_start + self.width].decode("ascii")
+            for row_start in range(0, self.width * self.height, self.width)
+        )
+
     def print(
         self,
         stream: IO[str] = sys.stdout,
@@ -223,27 +264,34 @@ class Layout(object):
         Args:
             stream: The IO stream where the map will be printed.
         """
-        for row in self:
-            for cell_value in row:
-                stream.write(CellTypeToAscii.get(cell_value, "u"))
-
-            stream.write("\n")
+        stream.write(self.to_string())
+        stream.write("\n")
         stream.flush()
 
 
-class Direction(Position, Enum):
+class Direction(Position):
     """Direction from a position.
 
     These constants can be added to a Position to obtain
     the position resulting from taking that action from
     that position.
+
+    The four instances are created right after the class body and
+    attached as class attributes, so `Direction.LEFT` style lookups
+    keep working without any `Enum` metaclass machinery; iteration
+    happens over the plain `DIRECTIONS` tuple.
     """
 
-    # Implicit call to __init__(x_coord, y_coord)
-    LEFT = -1, 0
-    RIGHT = 1, 0
-    UP = 0, -1
-    DOWN = 0, 1
+    __slots__ = ("bit", "_rev")
+
+    LEFT: Direction
+    RIGHT: Direction
+    UP: Direction
+    DOWN: Direction
+
+    def __init__(self, x_coord: int, y_coord: int, bit: int) -> None:
+        super().__init__(x_coord, y_coord)
+        self.bit = bit
 
     def reverse(self) -> Direction:
         """Get reverse direction.
@@ -251,7 +299,7 @@ class Direction(Position, Enum):
         Returns:
             Direction that reverses `self`.
         """
-        return _REVERSE_DIRECTIONS[self]
+        return self._rev
 
     def perpendicular(self) -> List[Direction]:
         """Directions perpendicular to self.
@@ -264,22 +312,64 @@ class Direction(Position, Enum):
         return [Direction.LEFT, Direction.RIGHT]
 
 
-_REVERSE_DIRECTIONS = MappingProxyType(
-    {
-        Direction.LEFT: Direction.RIGHT,
-        Direction.RIGHT: Direction.LEFT,
-        Direction.UP: Direction.DOWN,
-        Direction.DOWN: Direction.UP,
-    },
+# The direction constants, each carrying the wall bit used by the
+# grid's dense wall bitmask.
+Direction.LEFT = Direction(-1, 0, bit=1)
+Direction.RIGHT = Direction(1, 0, bit=2)
+Direction.UP = Direction(0, -1, bit=4)
+Direction.DOWN = Direction(0, 1, bit=8)
+
+#: All four directions, in the iteration order the old enum had.
+DIRECTIONS = (Direction.LEFT, Direction.RIGHT, Direction.UP, Direction.DOWN)
+
+# Reverse of each direction, stored as an instance attribute so that
+# reverse() is a plain attribute read instead of a dict lookup.
+Direction.LEFT._rev = Direction.RIGHT  # noqa: WPS437
+Direction.RIGHT._rev = Direction.LEFT  # noqa: WPS437
+Direction.UP._rev = Direction.DOWN  # noqa: WPS437
+Direction.DOWN._rev = Direction.UP  # noqa: WPS437
+
+#: Wall bitmask of a cell with all four walls closed.
+_ALL_WALLS = 0x0F
+
+#: Pre-computed stamps for `CellGrid.to_layout`: for each of the 16
+#: possible wall bitmasks, the bytes to write above, left and right of
+#: the cell center (down walls mirror the up wall of the row below).
+_WALL_STAMPS = tuple(
+    tuple(
+        CellType.WALL.value if wall_bits & direction.bit else CellType.EMPTY.value
+        for direction in (Direction.UP, Direction.LEFT, Direction.RIGHT)
+    )
+    for wall_bits in range(_ALL_WALLS + 1)
 )
 
 
 class Cell(object):
-    """Represents a layout cell."""
+    """Lightweight view over a single grid cell.
+
+    Cells no longer own their data: reads and writes proxy to the
+    grid's dense type and wall arrays (see `CellGrid`).
+    """
+
+    __slots__ = ("_types", "_walls", "_index")
+
+    def __init__(self, grid: CellGrid, index: int) -> None:
+        self._types = grid._types  # noqa: WPS437
+        self._walls = grid._walls  # noqa: WPS437
+        self._index = index
+
+    @property
+    def type(self) -> CellType:
+        """Cell type.
 
-    def __init__(self, cell_type: CellType = CellType.EMPTY) -> None:
-        self._walls = {direction: True for direction in Direction}
-        self.type = cell_type
+        Returns:
+            Type of the cell.
+        """
+        return CellType(self._types[self._index])
+
+    @type.setter
+    def type(self, cell_type: CellType) -> None:
+        self._types[self._index] = cell_type.value
 
     def open_wall(self, direction: Direction) -> None:
         """Marks the wall open.
@@ -287,7 +377,7 @@ class Cell(object):
         Args:
             direction: Direction of the wall that must be marked as open.
         """
-        self._walls[direction] = False
+        self._walls[self._index] &= _ALL_WALLS ^ direction.bit
 
     def count_open(self) -> int:
         """Count number of open walls.
@@ -295,7 +385,8 @@ class Cell(object):
         Returns:
             Number of open walls.
         """
-        return sum(self.is_open(direction) for direction in Direction)
+        closed = bin(self._walls[self._index]).count("1")
+        return len(DIRECTIONS) - closed
 
     def is_open(self, direction: Direction) -> bool:
         """Tests whether the wall is open or not.
@@ -306,7 +397,7 @@ class Cell(object):
         Returns:
             True if the wall going `direction` is open, otherwise False.
         """
-        return not self._walls[direction]
+        return not self._walls[self._index] & direction.bit
 
 
 class CellGrid(object):
@@ -316,8 +407,16 @@ class CellGrid(object):
     objects rather than directly accessing the underlying data
     structure. Moreover, it has a convenient method to create a layout
     that "looks" nice, from the grid cells values and walls.
+
+    Cells are stored structure-of-arrays style: one flat row-major
+    bytearray with the cell types and another with a 4-bit wall mask
+    per cell (2 bytes per cell overall).
     """
 
+    #: Neighbor tables only depend on the grid shape, so grids with the
+    #: same dimensions (e.g. batch generation runs) share one table pair.
+    _neighbor_cache: Dict[Tuple[int, int], Tuple[tuple, tuple]] = {}
+
     def __init__(
         self,
         width: int,
@@ -326,10 +425,23 @@ class CellGrid(object):
     ) -> None:
         self.width = width
         self.height = height
-        self._grid = [
-            [Cell(cell_type=init_type) for _ in range(self.width)]
-            for _ in range(self.height)
-        ]
+        self._types = bytearray([init_type.value] * (width * height))
+        self._walls = bytearray([_ALL_WALLS] * (width * height))
+        cached = self._neighbor_cache.get((width, height))
+        if cached is None:
+            cached = self._build_neighbor_tables()
+            self._neighbor_cache[(width, height)] = cached
+        self._neighbors, self._index_neighbors = cached
+        # Per-direction (index delta, cell mask, neighbor mask) rows so
+        # open_wall_index is two masked stores with no per-call math.
+        self._wall_updates = {
+            direction: (
+                direction.y_coord * width + direction.x_coord,
+                _ALL_WALLS ^ direction.bit,
+                _ALL_WALLS ^ direction.reverse().bit,
+            )
+            for direction in DIRECTIONS
+        }
 
     def __getitem__(self, position: Position) -> Cell:
         """Get cell.
@@ -338,9 +450,9 @@ class CellGrid(object):
             position: Cell to query.
 
         Returns:
-            Cell at `position`.
+            A view over the cell at `position`.
         """
-        return self._grid[position.y_coord][position.x_coord]
+        return Cell(self, position.y_coord * self.width + position.x_coord)
 
     def get_neighbors(
         self,
@@ -355,12 +467,58 @@ class CellGrid(object):
         Returns:
             Neighbors as a list of pairs (position, direction).
         """
-        all_neighbors = [(position + direction, direction) for direction in Direction]
-        return [
-            neighbor
-            for neighbor in all_neighbors
-            if not self.is_out_of_bounds(neighbor[0])
-        ]
+        return list(
+            self._neighbors[position.y_coord * self.width + position.x_coord],
+        )
+
+    def get_neighbor_indexes(
+        self,
+        cell_index: int,
+    ) -> List[Tuple[int, Direction]]:
+        """Neighbor flat-index and direction pairs.
+
+        Index-based counterpart of `get_neighbors` for generators that
+        track cells as packed `y * width + x` integers.
+
+        Args:
+            cell_index: Flat index of the cell from which the
+                neighbors are going to be computed.
+
+        Returns:
+            Neighbors as a list of pairs (cell index, direction).
+        """
+        return list(self._index_neighbors[cell_index])
+
+    def open_wall_index(self, cell_index: int, direction: Direction) -> None:
+        """Opens the wall that connects a cell with its neighbor.
+
+        Index-based counterpart of `open_wall`; callers are expected to
+        pass only in-bounds pairs, such as the ones obtained through
+        `get_neighbor_indexes`.
+
+        Args:
+            cell_index: Flat index of the cell to open.
+            direction: Direction of the wall from the cell to open.
+        """
+        delta, cell_mask, neighbor_mask = self._wall_updates[direction]
+        self._walls[cell_index] &= cell_mask
+        self._walls[cell_index + delta] &= neighbor_mask
+
+    def open_walls(self, edges: Iterable[Tuple[int, Direction]]) -> None:
+        """Opens the walls of every (cell index, direction) pair.
+
+        Bulk counterpart of `open_wall_index` that hoists the wall
+        array and update-table lookups out of the per-edge work.
+
+        Args:
+            edges: Pairs of flat cell index and direction to open.
+        """
+        walls = self._walls
+        wall_updates = self._wall_updates
+        for cell_index, direction in edges:
+            delta, cell_mask, neighbor_mask = wall_updates[direction]
+            walls[cell_index] &= cell_mask
+            walls[cell_index + delta] &= neighbor_mask
 
     def is_out_of_bounds(self, position: Position) -> bool:
         """Tests whether a position is out of bounds.
@@ -371,11 +529,57 @@ class CellGrid(object):
         Returns:
             True if it is out of bounds, otherwise False.
         """
-        return (
-            position.y_coord < 0
-            or position.y_coord >= self.height
-            or position.x_coord < 0
-            or position.x_coord >= self.width
+        return not (
+            0 <= position.x_coord < self.width
+            and 0 <= position.y_coord < self.height
+        )
+
+    def _build_neighbor_tables(self) -> Tuple[tuple, tuple]:
+        """Computes the neighbor tables for this grid's shape.
+
+        The shape is fixed, so neighbor pairs are computed once here
+        instead of on every get_neighbors call; the second table
+        mirrors the first with flat indices for generators that track
+        cells as packed integers instead of Positions.
+
+        Returns:
+            A pair with the Position-keyed and the index-keyed tables.
+        """
+        width = self.width
+        neighbors = tuple(
+            self._compute_neighbors(cell_index)
+            for cell_index in range(width * self.height)
+        )
+        index_neighbors = tuple(
+            tuple(
+                (neighbor.y_coord * width + neighbor.x_coord, direction)
+                for neighbor, direction in cell_neighbors
+            )
+            for cell_neighbors in neighbors
+        )
+        return neighbors, index_neighbors
+
+    def _compute_neighbors(self, cell_index: int) -> Tuple[
+        Tuple[Position, Direction],
+        ...,
+    ]:
+        """Computes the in-bounds neighbors of a cell.
+
+        Args:
+            cell_index: Flat index of the cell.
+
+        Returns:
+            Neighbors as a tuple of pairs (position, direction).
+        """
+        y_pos, x_pos = divmod(cell_index, self.width)
+        position = Position(x_pos, y_pos)
+        all_neighbors = [
+            (position + direction, direction) for direction in DIRECTIONS
+        ]
+        return tuple(
+            neighbor
+            for neighbor in all_neighbors
+            if not self.is_out_of_bounds(neighbor[0])
         )
 
     def open_wall(
@@ -398,12 +602,21 @@ class CellGrid(object):
                 "Cannot open wall as it goes out of bounds",
             )
 
-        self[position].open_wall(direction)
-        self[neighbor].open_wall(direction.reverse())
+        position_index = position.y_coord * self.width + position.x_coord
+        neighbor_index = neighbor.y_coord * self.width + neighbor.x_coord
+        self._walls[position_index] &= _ALL_WALLS ^ direction.bit
+        self._walls[neighbor_index] &= _ALL_WALLS ^ direction.reverse().bit
 
-    def to_layout(self) -> Layout:
+    def to_layout(self) -> Layout:  # noqa: WPS210
         """Creates a layout from the grid.
 
+        The layout is assembled one grid row at a time: the wall stripe
+        above the cells and the cell stripe itself are built in two
+        small row buffers and blitted into the layout in one slice
+        assignment each, so the working set stays at a couple of rows
+        no matter how large the map is. Down walls need no handling as
+        they mirror the up walls of the row below.
+
         Returns:
             A layout object constructed using information from
             the grid cells.
@@ -413,20 +626,32 @@ class CellGrid(object):
             height=2 * self.height + 1,
             init_type=CellType.WALL,
         )
-        for y_pos, row in enumerate(self._grid):
-            for x_pos, cell in enumerate(row):
-                layout_p = Position(x_coord=2 * x_pos + 1, y_coord=2 * y_pos + 1)
-
-                layout[layout_p] = cell.type
-
-                if cell.is_open(Direction.LEFT):
-                    layout[layout_p.left] = CellType.EMPTY
-                if cell.is_open(Direction.RIGHT):
-                    layout[layout_p.right] = CellType.EMPTY
-                if cell.is_open(Direction.UP):
-                    layout[layout_p.up] = CellType.EMPTY
-                if cell.is_open(Direction.DOWN):
-                    layout[layout_p.down] = CellType.EMPTY
+        layout_width = layout.width
+        layout_cells = layout._cells  # noqa: WPS437
+        wall = CellType.WALL.value
+        wall_stamps = _WALL_STAMPS
+        cell_types = self._types
+        walls = self._walls
+
+        for y_pos in range(self.height):
+            up_row = bytearray([wall] * layout_width)
+            cell_row = bytearray([wall] * layout_width)
+            row_start = y_pos * self.width
+
+            for x_pos in range(self.width):
+                cell_index = row_start + x_pos
+                center = 2 * x_pos + 1
+
+                up_byte, left_byte, right_byte = wall_stamps[walls[cell_index]]
+                cell_row[center] = cell_types[cell_index]
+                up_row[center] = up_byte
+                cell_row[center - 1] = left_byte
+                cell_row[center + 1] = right_byte
+
+            stripe_start = 2 * y_pos * layout_width
+            stripe_mid = stripe_start + layout_width
+            layout_cells[stripe_start:stripe_mid] = up_row
+            layout_cells[stripe_mid:stripe_mid + layout_width] = cell_row
 
         return layout
 
@@ -520,10 +745,10 @@ class LayoutGenerator(abc.ABC):
             List of corner positions
         """
         return [
-            Position(x_coord=0, y_coord=0),
-            Position(x_coord=0, y_coord=self.height - 1),
-            Position(x_coord=self.width - 1, y_coord=0),
-            Position(x_coord=self.width - 1, y_coord=self.height - 1),
+            Position(0, 0),
+            Position(0, self.height - 1),
+            Position(self.width - 1, 0),
+            Position(self.width - 1, self.height - 1),
         ]
 
     def random_position(
@@ -533,8 +758,9 @@ class LayoutGenerator(abc.ABC):
     ) -> Position:
         """Generates a random position.
 
-        The generated position will never fall in the first nor the last
-        row or column, as these are usually reserved for walls.
+        When `no_border` is set the position is sampled directly from
+        the grid interior, so no rejection loop is needed for borders;
+        re-sampling only happens on (rare) `forbidden` collisions.
 
         Args:
             no_border: Avoid border positions.
@@ -543,21 +769,20 @@ class LayoutGenerator(abc.ABC):
         Returns:
             A tuple containing the new position (x_pos, y_pos).
         """
-        forbidden = forbidden or []
+        forbidden = frozenset(forbidden) if forbidden else frozenset()
+        min_coord = 1 if no_border else 0
+        max_x = self.width - 2 if no_border else self.width - 1
+        max_y = self.height - 2 if no_border else self.height - 1
+
         rand_pos = Position(
-            x_coord=self.rand.randint(0, self.width - 1),
-            y_coord=self.rand.randint(0, self.height - 1),
+            self.rand.randint(min_coord, max_x),
+            self.rand.randint(min_coord, max_y),
         )
-        not_ok = self.is_border(rand_pos) and no_border
-        not_ok = not_ok or rand_pos in forbidden
-
-        while not_ok:
+        while rand_pos in forbidden:
             rand_pos = Position(
-                self.rand.randint(1, self.height - 2),
-                self.rand.randint(1, self.width - 2),
+                self.rand.randint(min_coord, max_x),
+                self.rand.randint(min_coord, max_y),
             )
-            not_ok = self.is_border(rand_pos) and no_border
-            not_ok = not_ok or rand_pos in forbidden
 
         return rand_pos
 
@@ -570,12 +795,35 @@ class LayoutGenerator(abc.ABC):
 
         Returns:
             A list with `count` distinct positions.
+
+        Raises:
+            ValueError: If `count` exceeds the number of positions
+                available to draw from.
         """
-        # We should validate count is not too big!
+        pool_width = self.width - 2 if no_border else self.width
+        pool_height = self.height - 2 if no_border else self.height
+        pool_size = pool_width * pool_height
+        if count > pool_size:
+            raise ValueError(
+                "Cannot generate {0} distinct positions, only {1} available".format(
+                    count,
+                    pool_size,
+                ),
+            )
+
+        if no_border:
+            # Distinct draws in one shot over the flattened interior.
+            return [
+                Position(1 + flat_index % pool_width, 1 + flat_index // pool_width)
+                for flat_index in self.rand.sample(range(pool_size), count)
+            ]
+
+        seen = set()
         positions: List[Position] = []
         while len(positions) < count:
-            position = self.random_position(no_border=no_border)
-            if position not in positions:
+            position = self.random_position()
+            if position not in seen:
+                seen.add(position)
                 positions.append(position)
         return positions
 
@@ -590,9 +838,9 @@ class LayoutGenerator(abc.ABC):
         """
         return (
             position.x_coord == 0
-            or position.x_coord == self.height - 1
+            or position.x_coord == self.width - 1
             or position.y_coord == 0
-            or position.y_coord == self.width - 1
+            or position.y_coord == self.height - 1
         )
 
     def is_out_of_bounds(self, position: Position) -> bool:
@@ -604,11 +852,9 @@ class LayoutGenerator(abc.ABC):
         Returns:
             True if it is out of bounds, otherwise False.
         """
-        return (
-            position.x_coord < 0
-            or position.y_coord >= self.height
-            or position.y_coord < 0
-            or position.y_coord >= self.width
+        return not (
+            0 <= position.x_coord < self.width
+            and 0 <= position.y_coord < self.height
         )
 
     @abc.abstractmethod
@@ -638,11 +884,13 @@ class LayoutGenerator(abc.ABC):
             grid: A previously generated grid with a spanning-tree like
                 structure
         """
+        rand_random = self.rand.random
+        cycle_probability = self.cycle_probability
         positions = (
-            Position(x_coord=x_coord, y_coord=y_coord)
-            for x_coord in range(self.width)
+            Position(x_coord, y_coord)
             for y_coord in range(self.height)
-            if self.rand.random() < self.cycle_probability
+            for x_coord in range(self.width)
+            if rand_random() < cycle_probability
         )
 
         for pos in positions:
@@ -683,13 +931,15 @@ def _create_cycle_ok(
     #  When this happens opening 3 and 4 would create to many
     #  openings, which is undesirable as in Pac-Man these do not
     #  look "nice".
+    position_cell = grid[position]
+    neighbor_cell = grid[neighbor]
     for p_direction in direction.perpendicular():
         p_position = position + p_direction  # perpendicular to position
 
         if (  # noqa: WPS337
             not grid.is_out_of_bounds(p_position)
-            and grid[position].is_open(p_direction)
-            and grid[neighbor].is_open(p_direction)
+            and position_cell.is_open(p_direction)
+            and neighbor_cell.is_open(p_direction)
             and grid[p_position].is_open(direction)
         ):
             return False
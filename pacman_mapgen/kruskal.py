@@ -1,4 +1,7 @@
-from pacman_mapgen.core import CellGrid, LayoutGenerator, Position
+from array import array
+from typing import MutableSequence
+
+from pacman_mapgen.core import DIRECTIONS, CellGrid, LayoutGenerator
 
 
 class KruskalLayoutGenerator(LayoutGenerator):
@@ -11,42 +14,77 @@ class KruskalLayoutGenerator(LayoutGenerator):
     def _create_paths(self, grid: CellGrid) -> None:  # noqa: WPS210
         """Opens paths using Kruskal's algorithm.
 
+        Cells are handled as packed `y * width + x` indices and their
+        sets are tracked with a union-find over those indices (union
+        by rank plus path halving), so every merge costs near constant
+        time and no Position objects are allocated in the loop.
+
         Args:
             grid: Grid to generate the layout with
         """
-        positions = [
-            Position(x_coord=x_pos, y_coord=y_pos)
-            for x_pos in range(self.width)
+        width = self.width
+        indexes = [
+            y_pos * width + x_pos
+            for x_pos in range(width)
             for y_pos in range(self.height)
         ]
-        walls = [
-            (position, direction)
-            for position in positions
-            for _, direction in grid.get_neighbors(position)
-        ]
+        direction_ids = {
+            direction: dir_id for dir_id, direction in enumerate(DIRECTIONS)
+        }
+        # Each wall packs into one 32-bit int: flat cell index in the
+        # high bits, direction id in the low two.
+        walls = array(
+            "I",
+            [
+                (cell_index << 2) | direction_ids[direction]
+                for cell_index in indexes
+                for _, direction in grid.get_neighbor_indexes(cell_index)
+            ],
+        )
         self.rand.shuffle(walls)
 
-        # Keep track of which set the cells belong to
-        cell_set = {position: idx for idx, position in enumerate(positions)}
-        set_cells = [{position} for position in positions]
+        # Packed C arrays keep the union-find working set small enough
+        # to stay cache resident even on large grids.
+        parent = array("i", range(width * self.height))
+        rank = bytearray(len(parent))
+
+        # Hoisted lookups for the carving loop.
+        open_wall = grid.open_wall_index
+        directions = DIRECTIONS
 
         while walls:
-            position, direction = walls.pop()
-            neighbor = position + direction
+            wall_code = walls.pop()
+            cell_index = wall_code >> 2
+            direction = directions[wall_code & 3]
+            neighbor_index = (
+                cell_index + direction.y_coord * width + direction.x_coord
+            )
 
-            p_set_idx = cell_set[position]
-            n_set_idx = cell_set[neighbor]
+            p_root = _find(parent, cell_index)
+            n_root = _find(parent, neighbor_index)
 
-            if p_set_idx != n_set_idx:
-                grid.open_wall(position, direction)
-                new_set_idx = min(p_set_idx, n_set_idx)
-                new_set = set_cells[p_set_idx].union(set_cells[n_set_idx])
-                is_p_set = p_set_idx == new_set_idx
+            if p_root != n_root:
+                open_wall(cell_index, direction)
 
-                # All cells from both sets now belong to new_set
-                set_cells[p_set_idx] = new_set if is_p_set else set()
-                set_cells[n_set_idx] = set() if is_p_set else new_set
-                for pos in new_set:
-                    cell_set[pos] = new_set_idx
+                # Union by rank: hang the shallower tree under the other
+                if rank[p_root] < rank[n_root]:
+                    p_root, n_root = n_root, p_root
+                parent[n_root] = p_root
+                if rank[p_root] == rank[n_root]:
+                    rank[p_root] += 1
 
-        assert not set_cells[1], "All cells must belong to set 0"  # noqa: S101
+
+def _find(parent: MutableSequence[int], index: int) -> int:
+    """Finds the union-find root of `index`, halving the path on the way.
+
+    Args:
+        parent: Union-find parent array.
+        index: Flat cell index to look up.
+
+    Returns:
+        Root index of the set `index` belongs to.
+    """
+    while parent[index] != index:
+        parent[index] = parent[parent[index]]
+        index = parent[index]
+    return index
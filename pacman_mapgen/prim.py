@@ -11,22 +11,38 @@ class PrimLayoutGenerator(LayoutGenerator):
     def _create_paths(self, grid: CellGrid) -> None:  # noqa: WPS210
         """Opens paths using Prims's algorithm.
 
+        Cells are handled as packed `y * width + x` indices, so the
+        carving loop only juggles small integers and tuples.
+
         Args:
             grid: Grid to generate the layout with
         """
-        cur_pos = self.random_position(no_border=False)
-        pending = grid.get_neighbors(cur_pos)
-        visited = {cur_pos}
+        start = self.random_position(no_border=False)
+        start_index = start.y_coord * self.width + start.x_coord
+        pending = grid.get_neighbor_indexes(start_index)
+
+        # One byte per cell: membership is a plain index instead of a
+        # Position hash and set probe.
+        visited = bytearray(self.width * self.height)
+        visited[start_index] = 1
+
+        # Hoisted lookups for the carving loop.
+        get_neighbor_indexes = grid.get_neighbor_indexes
+        open_wall = grid.open_wall_index
+        randrange = self.rand.randrange
 
         while pending:
-            cur_pos, direction = pending.pop()
+            # Swap a random pending edge to the back and pop it: one
+            # O(1) draw per step instead of reshuffling the whole list.
+            swap_index = randrange(len(pending))
+            pending[swap_index], pending[-1] = pending[-1], pending[swap_index]
+            cell_index, direction = pending.pop()
 
-            if cur_pos not in visited:
-                grid.open_wall(cur_pos, direction.reverse())
+            if not visited[cell_index]:
+                open_wall(cell_index, direction.reverse())
                 pending.extend(
-                    (neighbor, direction)
-                    for neighbor, direction in grid.get_neighbors(cur_pos)
-                    if neighbor not in visited
+                    (neighbor_index, direction)
+                    for neighbor_index, direction in get_neighbor_indexes(cell_index)
+                    if not visited[neighbor_index]
                 )
-                self.rand.shuffle(pending)
-                visited.add(cur_pos)
+                visited[cell_index] = 1
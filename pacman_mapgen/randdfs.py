@@ -12,30 +12,49 @@ class RandomizedDfsLayoutGenerator(LayoutGenerator):
         """Opens path traversing the grid using a randomized DFS.
 
         At every step we expand the last node in the fringe, adding the
-        neighbors in random order every time.
+        neighbors in random order every time. Cells are handled as
+        packed `y * width + x` indices throughout the traversal.
 
         Args:
             grid: Grid to generate the layout with.
         """
         position = self.random_position()
-        neighbors = grid.get_neighbors(position)
+        cell_index = position.y_coord * self.width + position.x_coord
+        neighbors = grid.get_neighbor_indexes(cell_index)
 
-        fringe = [(position, neighbors)]
-        visited = {position}
+        fringe = [(cell_index, neighbors)]
+
+        # One byte per cell: membership is a plain index instead of a
+        # Position hash and set probe.
+        visited = bytearray(self.width * self.height)
+        visited[cell_index] = 1
+
+        # Hoisted lookups for the carving loop, which runs once per
+        # grid cell and several times per neighbor.
+        get_neighbor_indexes = grid.get_neighbor_indexes
+        open_wall = grid.open_wall_index
+        randrange = self.rand.randrange
 
         while fringe:
-            position, neighbors = fringe[-1]
-            neighbor, direction = neighbors.pop()
+            cell_index, neighbors = fringe[-1]
+
+            # Lazy Fisher-Yates: draw only the neighbor being popped
+            # instead of shuffling the whole list when it is pushed.
+            swap_index = randrange(len(neighbors))
+            neighbors[swap_index], neighbors[-1] = (
+                neighbors[-1],
+                neighbors[swap_index],
+            )
+            neighbor_index, direction = neighbors.pop()
 
             # Last neighbor removed, no need to re-explore
             if not neighbors:
                 fringe.pop()
 
-            if neighbor not in visited:
-                grid.open_wall(position, direction)
-                visited.add(neighbor)
-                next_neighbors = grid.get_neighbors(neighbor)
+            if not visited[neighbor_index]:
+                open_wall(cell_index, direction)
+                visited[neighbor_index] = 1
+                next_neighbors = get_neighbor_indexes(neighbor_index)
 
                 if next_neighbors:
-                    self.rand.shuffle(next_neighbors)
-                    fringe.append((neighbor, next_neighbors))
+                    fringe.append((neighbor_index, next_neighbors))
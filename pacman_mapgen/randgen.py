@@ -1,11 +1,28 @@
-import itertools
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
 
-from pacman_mapgen.core import CellGrid, LayoutGenerator, Position
+from pacman_mapgen.core import (
+    CellGrid,
+    Direction,
+    Layout,
+    LayoutGenerator,
+    ProblemType,
+)
+
+
+#: Below this probability the sparse geometric-gap sampler needs fewer
+#: random draws than the batched byte-lane sweep.
+_SPARSE_PROBABILITY_LIMIT = 0.25
 
 
 class RandomLayoutGenerator(LayoutGenerator):
     """Simple random layout generator."""
 
+    #: Edge tables only depend on the grid shape, so generator
+    #: instances with the same dimensions share one table.
+    _edge_cache: Dict[Tuple[int, int], List[Tuple[int, Direction]]] = {}
+
     def __init__(
         self,
         width: int,
@@ -23,6 +40,61 @@ class RandomLayoutGenerator(LayoutGenerator):
         self.wall_probability = wall_probability
         if self.wall_probability <= 0 or self.wall_probability > 1.0:  # noqa: WPS459
             raise ValueError("Wall probability must be between 0 and 1")
+        # Byte-lane threshold: sampling draws one random byte per edge
+        # and opens the wall when it falls below the quantized
+        # probability (1/256 resolution).
+        self._wall_threshold = int(self.wall_probability * (1 << 8))
+
+    @classmethod
+    def generate_many(  # noqa: WPS211
+        cls,
+        count: int,
+        width: int,
+        height: int,
+        base_seed: int,
+        cycle_probability: float,
+        wall_probability: float,
+        problem_type: ProblemType,
+        max_food: int,
+    ) -> List[Layout]:
+        """Generates `count` layouts across worker processes.
+
+        Layout generation is independent per seed, so batches are
+        farmed out to a process pool; worker `offset` builds its own
+        generator seeded with `base_seed + offset`, which keeps the
+        results reproducible regardless of scheduling.
+
+        Args:
+            count: Number of layouts to generate.
+            width: Width of the generated layouts.
+            height: Height of the generated layouts.
+            base_seed: Seed of the first layout; worker `offset` uses
+                `base_seed + offset`.
+            cycle_probability: Probability of opening additional walls
+                to create cycles.
+            wall_probability: Probability of opening the wall between
+                two cells.
+            problem_type: Pac-Man project problem type.
+            max_food: Maximum number of food cells when problem type
+                is `ProblemType.Food`.
+
+        Returns:
+            The generated layouts, ordered by seed offset.
+        """
+        tasks = [
+            (
+                width,
+                height,
+                base_seed + offset,
+                cycle_probability,
+                wall_probability,
+                problem_type,
+                max_food,
+            )
+            for offset in range(count)
+        ]
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(_generate_one, tasks))
 
     def _create_paths(self, grid: CellGrid) -> None:
         """Opens paths with random probability.
@@ -32,11 +104,100 @@ class RandomLayoutGenerator(LayoutGenerator):
         Args:
             grid: Grid to generate the layout with
         """
-        for x_pos, y_pos in itertools.product(  # noqa: WPS352
-            range(self.width),
-            range(self.height),
-        ):
-            position = Position(x_coord=x_pos, y_coord=y_pos)
-            for _, direction in grid.get_neighbors(position):
-                if self.rand.random() < self.wall_probability:
-                    grid.open_wall(position, direction)
+        # Hoisted lookups for the sampling pass, which draws once per
+        # cell-neighbor edge.
+        wall_threshold = self._wall_threshold
+        getrandbits = self.rand.getrandbits
+
+        edges = self._edge_cache.get((self.width, self.height))
+        if edges is None:
+            get_neighbor_indexes = grid.get_neighbor_indexes
+            edges = [
+                (cell_index, direction)
+                for cell_index in range(self.width * self.height)
+                for _, direction in get_neighbor_indexes(cell_index)
+            ]
+            self._edge_cache[(self.width, self.height)] = edges
+
+        # Degenerate but valid configuration: every wall opens, so no
+        # sampling is needed at all. Probabilities <= 0 are rejected
+        # by __init__.
+        if self.wall_probability >= 1:
+            grid.open_walls(edges)
+            return
+
+        # Probabilities below the 1/256 quantization step never open
+        # anything, so skip the sampling machinery altogether.
+        if not self._wall_threshold:
+            return
+
+        if self.wall_probability < _SPARSE_PROBABILITY_LIMIT:
+            self._open_sparse(grid, edges)
+            return
+
+        # One big draw supplies an 8-bit lane per edge, amortizing the
+        # RNG machinery over the whole grid; hits then open in bulk.
+        edge_count = len(edges)
+        lanes = getrandbits(8 * edge_count).to_bytes(edge_count, "little")
+        grid.open_walls(
+            edge
+            for edge, lane in zip(edges, lanes)
+            if lane < wall_threshold
+        )
+
+    def _open_sparse(
+        self,
+        grid: CellGrid,
+        edges: List[Tuple[int, Direction]],
+    ) -> None:
+        """Opens edges by drawing geometric gaps between hits.
+
+        When most edges stay closed it is cheaper to sample how many
+        misses precede the next hit (inverse transform of the
+        geometric distribution) than to draw one value per edge: the
+        expected number of draws equals the number of opened walls.
+
+        Args:
+            grid: Grid whose walls are being opened.
+            edges: Flat edge table to sample from.
+        """
+        rand_random = self.rand.random
+        open_wall = grid.open_wall_index
+        # Same 1/256 probability quantization as the byte-lane sweep.
+        log_miss = math.log1p(-self._wall_threshold / (1 << 8))
+        edge_count = len(edges)
+
+        edge_index = int(math.log(1 - rand_random()) / log_miss)
+        while edge_index < edge_count:
+            cell_index, direction = edges[edge_index]
+            open_wall(cell_index, direction)
+            edge_index += 1 + int(math.log(1 - rand_random()) / log_miss)
+
+
+def _generate_one(
+    task: Tuple[int, int, int, float, float, ProblemType, int],
+) -> Layout:
+    """Builds a generator and produces a single layout.
+
+    Module-level so the process pool in `generate_many` can pickle it.
+
+    Args:
+        task: Packed (width, height, seed, cycle_probability,
+            wall_probability, problem_type, max_food) tuple.
+
+    Returns:
+        The generated layout.
+    """
+    width, height, seed, cycle_probability, wall_probability = task[:5]
+    problem_type, max_food = task[5:]
+    generator = RandomLayoutGenerator(
+        width=width,
+        height=height,
+        seed=seed,
+        cycle_probability=cycle_probability,
+        wall_probability=wall_probability,
+    )
+    return generator.generate_layout(
+        problem_type=problem_type,
+        max_food=max_food,
+    )
@@ -12,6 +12,8 @@ class StrEnum(str, enum.Enum):  # noqa: WPS600
         In Python 3.11 you should use StrEnum from the standard library.
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         """String representation of the str-based enum object.
 